@@ -19,6 +19,7 @@ from slack_workspace_synth.generator import (
     generate_messages,
     generate_users,
     generate_workspace,
+    iter_batches,
 )
 from slack_workspace_synth.plugins import PluginRegistry
 from slack_workspace_synth.storage import SCHEMA_VERSION, SQLiteStore, dump_json, dump_jsonl
@@ -115,62 +116,55 @@ def main(argv: list[str] | None = None) -> int:
     t0 = time.perf_counter()
     store = SQLiteStore(str(db_path))
     try:
-        workspace_obj = generate_workspace(config, plugins)
-        store.insert_workspace(workspace_obj)
-        store.set_workspace_meta(
-            workspace_obj.id,
-            {
-                "generator": "slack-workspace-synth",
-                "generator_version": __import__("slack_workspace_synth").__version__,
-                "schema_version": SCHEMA_VERSION,
-                "seed": config.seed,
-                "requested": {
-                    "users": config.users,
-                    "channels": config.channels,
-                    "dm_channels": config.dm_channels,
-                    "mpdm_channels": config.mpdm_channels,
-                    "messages": config.messages,
-                    "files": config.files,
-                    "batch_size": config.batch_size,
-                    "workspace_name": config.workspace_name,
-                    "profile": args.profile,
+        with store.transaction():
+            workspace_obj = generate_workspace(config, plugins)
+            store.insert_workspace(workspace_obj)
+            store.set_workspace_meta(
+                workspace_obj.id,
+                {
+                    "generator": "slack-workspace-synth",
+                    "generator_version": __import__("slack_workspace_synth").__version__,
+                    "schema_version": SCHEMA_VERSION,
+                    "seed": config.seed,
+                    "requested": {
+                        "users": config.users,
+                        "channels": config.channels,
+                        "dm_channels": config.dm_channels,
+                        "mpdm_channels": config.mpdm_channels,
+                        "messages": config.messages,
+                        "files": config.files,
+                        "batch_size": config.batch_size,
+                        "workspace_name": config.workspace_name,
+                        "profile": args.profile,
+                    },
                 },
-            },
-        )
+            )
 
-        users = generate_users(config, workspace_obj.id, rng, faker, plugins)
-        store.insert_users(users)
+            users = generate_users(config, workspace_obj.id, rng, faker, plugins)
+            store.insert_users(users)
 
-        channels = generate_channels(config, workspace_obj.id, rng, faker, plugins)
-        store.insert_channels(channels)
+            channels = generate_channels(config, workspace_obj.id, rng, faker, plugins)
+            store.insert_channels(channels)
 
-        channel_members = generate_channel_members(config, workspace_obj.id, users, channels, rng)
-        store.insert_channel_members(channel_members)
+            channel_members = generate_channel_members(
+                config, workspace_obj.id, users, channels, rng
+            )
+            store.insert_channel_members(channel_members)
 
-        user_ids = [u.id for u in users]
-        channel_ids = [c.id for c in channels]
+            user_ids = [u.id for u in users]
+            channel_ids = [c.id for c in channels]
 
-        message_buffer = []
-        for msg in generate_messages(
-            config, workspace_obj.id, user_ids, channel_ids, rng, faker, plugins
-        ):
-            message_buffer.append(msg)
-            if len(message_buffer) >= config.batch_size:
-                store.insert_messages(message_buffer)
-                message_buffer = []
-        if message_buffer:
-            store.insert_messages(message_buffer)
+            message_stream = generate_messages(
+                config, workspace_obj.id, user_ids, channel_ids, rng, faker, plugins
+            )
+            for message_batch in iter_batches(message_stream, config.batch_size):
+                store.insert_messages(message_batch)
 
-        file_buffer = []
-        for f in generate_files(
-            config, workspace_obj.id, user_ids, channel_ids, rng, faker, plugins
-        ):
-            file_buffer.append(f)
-            if len(file_buffer) >= config.batch_size:
-                store.insert_files(file_buffer)
-                file_buffer = []
-        if file_buffer:
-            store.insert_files(file_buffer)
+            file_stream = generate_files(
+                config, workspace_obj.id, user_ids, channel_ids, rng, faker, plugins
+            )
+            for file_batch in iter_batches(file_stream, config.batch_size):
+                store.insert_files(file_batch)
     finally:
         store.close()
     gen_seconds = time.perf_counter() - t0
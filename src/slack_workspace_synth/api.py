@@ -1,13 +1,50 @@
 from __future__ import annotations
 
 import os
+import queue
 import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 
 from fastapi import FastAPI, HTTPException, Query, Response
 
 from .storage import SQLiteStore
 
-app = FastAPI(title="Slack Workspace Synth")
+# Read-only stores are reused across requests instead of reopening the DB every time.
+# Pools are keyed by the resolved path and tied to the file's (st_dev, st_ino) so a DB
+# replaced on disk gets fresh connections; stores beyond _POOL_SIZE idle ones are closed
+# when released. The ``db`` path is client-supplied, so at most _MAX_POOLS paths keep
+# pools; the least recently used one is drained when another path needs a slot.
+_POOL_SIZE = 4
+_MAX_POOLS = 8
+_pools: OrderedDict[str, tuple[tuple[int, int], queue.SimpleQueue[SQLiteStore]]] = OrderedDict()
+_pools_lock = threading.Lock()
+
+
+def _drain(pool: queue.SimpleQueue[SQLiteStore]) -> None:
+    while True:
+        try:
+            pool.get_nowait().close()
+        except queue.Empty:
+            return
+
+
+def close_store_pools() -> None:
+    with _pools_lock:
+        for _, pool in _pools.values():
+            _drain(pool)
+        _pools.clear()
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    close_store_pools()
+
+
+app = FastAPI(title="Slack Workspace Synth", lifespan=_lifespan)
 
 
 @app.get("/healthz")
@@ -22,38 +59,86 @@ def _resolve_db(db: str | None) -> str:
     return resolved
 
 
-def _store(db: str | None) -> SQLiteStore:
-    path = _resolve_db(db)
+def _open_store(path: str) -> SQLiteStore:
     try:
         return SQLiteStore(path, read_only=True)
     except (sqlite3.OperationalError, sqlite3.DatabaseError) as exc:
         raise HTTPException(status_code=400, detail=f"invalid db path: {path} ({exc})") from None
 
 
+def _pool_for(key: str) -> queue.SimpleQueue[SQLiteStore] | None:
+    try:
+        st = os.stat(key)
+    except OSError:
+        st = None
+    with _pools_lock:
+        entry = _pools.pop(key, None)
+        if st is None:
+            if entry is not None:
+                _drain(entry[1])
+            return None
+        identity = (st.st_dev, st.st_ino)
+        if entry is None or entry[0] != identity:
+            if entry is not None:
+                _drain(entry[1])
+            entry = (identity, queue.SimpleQueue())
+        _pools[key] = entry
+        while len(_pools) > _MAX_POOLS:
+            _drain(_pools.popitem(last=False)[1][1])
+        return entry[1]
+
+
+def _release(key: str, pool: queue.SimpleQueue[SQLiteStore], store: SQLiteStore) -> None:
+    with _pools_lock:
+        # The pool may have been evicted or replaced while the store was checked out.
+        entry = _pools.get(key)
+        keep = entry is not None and entry[1] is pool and pool.qsize() < _POOL_SIZE
+        if keep:
+            pool.put(store)
+    if not keep:
+        store.close()
+
+
+@contextmanager
+def _store(db: str | None) -> Iterator[SQLiteStore]:
+    path = _resolve_db(db)
+    key = os.path.realpath(path)
+    pool = _pool_for(key)
+    store: SQLiteStore | None = None
+    if pool is not None:
+        try:
+            store = pool.get_nowait()
+        except queue.Empty:
+            pass
+    if store is None:
+        store = _open_store(path)
+    try:
+        yield store
+    finally:
+        if pool is not None:
+            _release(key, pool, store)
+        else:
+            store.close()
+
+
 @app.get("/workspaces")
 def list_workspaces(
     db: str | None = Query(None, description="Path to SQLite DB"),
 ) -> list[dict[str, object]]:
-    store = _store(db)
-    try:
+    with _store(db) as store:
         return store.list_workspaces()
-    finally:
-        store.close()
 
 
 @app.get("/workspaces/{workspace_id}")
 def get_workspace(
     workspace_id: str, db: str | None = Query(None, description="Path to SQLite DB")
 ) -> dict[str, object]:
-    store = _store(db)
-    try:
+    with _store(db) as store:
         workspace = store.get_workspace(workspace_id)
         if not workspace:
             raise HTTPException(status_code=404, detail="workspace not found")
         summary = store.export_summary(workspace_id)
         return summary
-    finally:
-        store.close()
 
 
 @app.get("/workspaces/{workspace_id}/users")
@@ -67,11 +152,12 @@ def list_users(
         None, description="Keyset cursor (preferred over offset for large tables)"
     ),
 ) -> list[dict[str, object]]:
-    store = _store(db)
-    try:
+    with _store(db) as store:
         if cursor is not None and offset != 0:
             raise HTTPException(status_code=400, detail="Use cursor or offset, not both")
-        if cursor is not None:
+        # First pages go through the keyset query as well, so clients get X-Next-Cursor
+        # up front; OFFSET is only used when explicitly asked for (same for all lists).
+        if cursor is not None or offset == 0:
             try:
                 rows, next_cursor = store.list_users_page(workspace_id, limit=limit, cursor=cursor)
             except ValueError as e:
@@ -80,8 +166,6 @@ def list_users(
                 response.headers["X-Next-Cursor"] = next_cursor
             return rows
         return store.list_users(workspace_id, limit, offset)
-    finally:
-        store.close()
 
 
 @app.get("/workspaces/{workspace_id}/channels")
@@ -96,11 +180,10 @@ def list_channels(
         None, description="Keyset cursor (preferred over offset for large tables)"
     ),
 ) -> list[dict[str, object]]:
-    store = _store(db)
-    try:
+    with _store(db) as store:
         if cursor is not None and offset != 0:
             raise HTTPException(status_code=400, detail="Use cursor or offset, not both")
-        if cursor is not None:
+        if cursor is not None or offset == 0:
             try:
                 rows, next_cursor = store.list_channels_page(
                     workspace_id, limit=limit, cursor=cursor, channel_type=channel_type
@@ -111,8 +194,6 @@ def list_channels(
                 response.headers["X-Next-Cursor"] = next_cursor
             return rows
         return store.list_channels(workspace_id, limit, offset, channel_type=channel_type)
-    finally:
-        store.close()
 
 
 @app.get("/workspaces/{workspace_id}/channel-members")
@@ -127,11 +208,10 @@ def list_channel_members(
         None, description="Keyset cursor (preferred over offset for large tables)"
     ),
 ) -> list[dict[str, object]]:
-    store = _store(db)
-    try:
+    with _store(db) as store:
         if cursor is not None and offset != 0:
             raise HTTPException(status_code=400, detail="Use cursor or offset, not both")
-        if cursor is not None:
+        if cursor is not None or offset == 0:
             try:
                 rows, next_cursor = store.list_channel_members_page(
                     workspace_id, limit=limit, cursor=cursor, channel_id=channel_id
@@ -142,8 +222,6 @@ def list_channel_members(
                 response.headers["X-Next-Cursor"] = next_cursor
             return rows
         return store.list_channel_members(workspace_id, limit, offset, channel_id=channel_id)
-    finally:
-        store.close()
 
 
 @app.get("/workspaces/{workspace_id}/messages")
@@ -161,14 +239,13 @@ def list_messages(
     before_ts: int | None = Query(None, ge=0),
     after_ts: int | None = Query(None, ge=0),
 ) -> list[dict[str, object]]:
-    store = _store(db)
-    try:
+    with _store(db) as store:
         use_keyset = cursor is not None or any(
             v is not None for v in (channel_id, user_id, before_ts, after_ts)
         )
         if use_keyset and offset != 0:
             raise HTTPException(status_code=400, detail="Use cursor or offset, not both")
-        if use_keyset:
+        if use_keyset or offset == 0:
             try:
                 rows, next_cursor = store.list_messages_page(
                     workspace_id,
@@ -185,8 +262,6 @@ def list_messages(
                 response.headers["X-Next-Cursor"] = next_cursor
             return rows
         return store.list_messages(workspace_id, limit, offset)
-    finally:
-        store.close()
 
 
 @app.get("/workspaces/{workspace_id}/files")
@@ -204,14 +279,13 @@ def list_files(
     before_ts: int | None = Query(None, ge=0, description="Filter by created_ts < before_ts"),
     after_ts: int | None = Query(None, ge=0, description="Filter by created_ts > after_ts"),
 ) -> list[dict[str, object]]:
-    store = _store(db)
-    try:
+    with _store(db) as store:
         use_keyset = cursor is not None or any(
             v is not None for v in (channel_id, user_id, before_ts, after_ts)
         )
         if use_keyset and offset != 0:
             raise HTTPException(status_code=400, detail="Use cursor or offset, not both")
-        if use_keyset:
+        if use_keyset or offset == 0:
             try:
                 rows, next_cursor = store.list_files_page(
                     workspace_id,
@@ -228,5 +302,3 @@ def list_files(
                 response.headers["X-Next-Cursor"] = next_cursor
             return rows
         return store.list_files(workspace_id, limit, offset)
-    finally:
-        store.close()
@@ -7,7 +7,9 @@ import random
 import time
 import uuid
 import zipfile
+from collections.abc import Iterator
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 from urllib.error import HTTPError, URLError
@@ -25,6 +27,7 @@ from .generator import (
     generate_messages,
     generate_users,
     generate_workspace,
+    iter_batches,
 )
 from .models import Channel, ChannelMember, File, Message, User, Workspace
 from .plugins import PluginRegistry, load_plugins
@@ -34,6 +37,10 @@ app = typer.Typer(add_completion=False)
 
 _PKG_VERSION = __import__("slack_workspace_synth").__version__
 
+# Slack retry/backoff and pacing sleep through this alias so tests can swap it on the
+# module instead of patching time.sleep process-wide.
+_sleep = time.sleep
+
 
 def _resolve_plugins(modules: list[str] | None) -> PluginRegistry:
     if not modules:
@@ -55,6 +62,19 @@ def _sanitize_folder_name(name: str) -> str:
     return clean.strip("-") or "conversation"
 
 
+@lru_cache(maxsize=256)
+def _slack_reactions(reactions_json: str) -> list[dict[str, Any]] | None:
+    # Stored reactions are a {name: count} object with few distinct values in practice, so
+    # each is parsed once; the returned list is shared between messages and never mutated.
+    try:
+        payload = json.loads(reactions_json)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    return [{"name": name, "count": int(count), "users": []} for name, count in payload.items()]
+
+
 def _load_json(path: str) -> dict[str, Any]:
     with open(path, encoding="utf-8") as handle:
         payload = json.load(handle)
@@ -133,7 +153,7 @@ def _slack_sleep_with_backoff(attempt: int, *, max_backoff_seconds: int) -> None
     base = 0.5 * (2**attempt)
     # Jitter in [0.5, 1.0] keeps concurrent seeders from syncing retries.
     delay = min(float(max_backoff_seconds), base) * (0.5 + 0.5 * random.random())
-    time.sleep(delay)
+    _sleep(delay)
 
 
 def _slack_request_json(
@@ -165,7 +185,7 @@ def _slack_request_json(
                     retry_after = max(0, int(retry_after_raw))
                 except ValueError:
                     retry_after = 1
-                time.sleep(retry_after)
+                _sleep(retry_after)
                 continue
 
             if exc.code in {408} or 500 <= exc.code <= 599:
@@ -597,73 +617,65 @@ def generate(
 
     store = SQLiteStore(db)
     try:
-        workspace_obj = generate_workspace(config, plugins)
-        store.insert_workspace(workspace_obj)
-        store.set_workspace_meta(
-            workspace_obj.id,
-            {
-                "generator": "slack-workspace-synth",
-                "generator_version": _PKG_VERSION,
-                "schema_version": SCHEMA_VERSION,
-                "seed": seed,
-                "requested": {
-                    "users": resolved_users,
-                    "channels": resolved_channels,
-                    "dm_channels": resolved_dm_channels,
-                    "mpdm_channels": resolved_mpdm_channels,
-                    "messages": resolved_messages,
-                    "files": resolved_files,
-                    "batch_size": batch_size,
-                    "workspace_name": workspace,
-                    "profile": profile,
-                    "channel_members_min": resolved_channel_members_min,
-                    "channel_members_max": resolved_channel_members_max,
-                    "mpdm_members_min": resolved_mpdm_members_min,
-                    "mpdm_members_max": resolved_mpdm_members_max,
-                    "plugins": plugin or [],
+        with store.transaction():
+            workspace_obj = generate_workspace(config, plugins)
+            store.insert_workspace(workspace_obj)
+            store.set_workspace_meta(
+                workspace_obj.id,
+                {
+                    "generator": "slack-workspace-synth",
+                    "generator_version": _PKG_VERSION,
+                    "schema_version": SCHEMA_VERSION,
+                    "seed": seed,
+                    "requested": {
+                        "users": resolved_users,
+                        "channels": resolved_channels,
+                        "dm_channels": resolved_dm_channels,
+                        "mpdm_channels": resolved_mpdm_channels,
+                        "messages": resolved_messages,
+                        "files": resolved_files,
+                        "batch_size": batch_size,
+                        "workspace_name": workspace,
+                        "profile": profile,
+                        "channel_members_min": resolved_channel_members_min,
+                        "channel_members_max": resolved_channel_members_max,
+                        "mpdm_members_min": resolved_mpdm_members_min,
+                        "mpdm_members_max": resolved_mpdm_members_max,
+                        "plugins": plugin or [],
+                    },
                 },
-            },
-        )
+            )
 
-        user_list = generate_users(config, workspace_obj.id, rng, faker, plugins)
-        store.insert_users(user_list)
+            user_list = generate_users(config, workspace_obj.id, rng, faker, plugins)
+            store.insert_users(user_list)
 
-        channel_list = generate_channels(config, workspace_obj.id, rng, faker, plugins)
-        store.insert_channels(channel_list)
+            channel_list = generate_channels(config, workspace_obj.id, rng, faker, plugins)
+            store.insert_channels(channel_list)
 
-        user_ids = [u.id for u in user_list]
-        channel_ids = [c.id for c in channel_list]
+            user_ids = [u.id for u in user_list]
+            channel_ids = [c.id for c in channel_list]
 
-        channel_members = generate_channel_members(
-            config, workspace_obj.id, user_list, channel_list, rng
-        )
-        store.insert_channel_members(channel_members)
+            channel_members = generate_channel_members(
+                config, workspace_obj.id, user_list, channel_list, rng
+            )
+            store.insert_channel_members(channel_members)
 
-        message_buffer = []
-        for message in generate_messages(
-            config, workspace_obj.id, user_ids, channel_ids, rng, faker, plugins
-        ):
-            message_buffer.append(message)
-            if len(message_buffer) >= config.batch_size:
-                store.insert_messages(message_buffer)
-                message_buffer = []
-        if message_buffer:
-            store.insert_messages(message_buffer)
-
-        file_buffer = []
-        for file_item in generate_files(
-            config, workspace_obj.id, user_ids, channel_ids, rng, faker, plugins
-        ):
-            file_buffer.append(file_item)
-            if len(file_buffer) >= config.batch_size:
-                store.insert_files(file_buffer)
-                file_buffer = []
-        if file_buffer:
-            store.insert_files(file_buffer)
+            message_stream = generate_messages(
+                config, workspace_obj.id, user_ids, channel_ids, rng, faker, plugins
+            )
+            for message_batch in iter_batches(message_stream, config.batch_size):
+                store.insert_messages(message_batch)
+
+            file_stream = generate_files(
+                config, workspace_obj.id, user_ids, channel_ids, rng, faker, plugins
+            )
+            for file_batch in iter_batches(file_stream, config.batch_size):
+                store.insert_files(file_batch)
 
         if export_summary:
             summary = store.export_summary(workspace_obj.id)
             dump_json(export_summary, summary)
+        store.optimize()
     finally:
         store.close()
 
@@ -746,9 +758,6 @@ def import_jsonl(
                     "Workspace id already exists with a different name; "
                     "use a fresh DB or choose a different export/workspace-id."
                 )
-        store.insert_workspace(workspace_obj, ignore=ignore)
-        if meta:
-            store.set_workspace_meta(workspace_obj.id, meta)
 
         def _get_str(row: dict[str, Any], key: str, default: str | None = None) -> str:
             value = row.get(key, default)
@@ -766,111 +775,90 @@ def import_jsonl(
             value = row.get(key)
             return int(value) if value is not None else None
 
-        def _import_users(path: Path) -> None:
-            buffer: list[User] = []
+        def _rows(path: Path) -> Iterator[dict[str, Any]]:
             for row in load_jsonl(str(path)):
-                data = row if isinstance(row, dict) else {}
-                buffer.append(
-                    User(
-                        id=_get_str(data, "id"),
-                        workspace_id=_get_str(data, "workspace_id", workspace_obj.id),
-                        name=_get_str(data, "name"),
-                        email=_get_str(data, "email"),
-                        title=_get_str(data, "title"),
-                        is_bot=_get_int(data, "is_bot"),
-                    )
+                yield row if isinstance(row, dict) else {}
+
+        def _import_users(path: Path) -> None:
+            users = (
+                User(
+                    id=_get_str(data, "id"),
+                    workspace_id=_get_str(data, "workspace_id", workspace_obj.id),
+                    name=_get_str(data, "name"),
+                    email=_get_str(data, "email"),
+                    title=_get_str(data, "title"),
+                    is_bot=_get_int(data, "is_bot"),
                 )
-                if len(buffer) >= batch_size:
-                    store.insert_users(buffer, ignore=ignore)
-                    buffer = []
-            if buffer:
-                store.insert_users(buffer, ignore=ignore)
+                for data in _rows(path)
+            )
+            for batch in iter_batches(users, batch_size):
+                store.insert_users(batch, ignore=ignore)
 
         def _import_channels(path: Path) -> None:
-            buffer: list[Channel] = []
-            for row in load_jsonl(str(path)):
-                data = row if isinstance(row, dict) else {}
-                buffer.append(
-                    Channel(
-                        id=_get_str(data, "id"),
-                        workspace_id=_get_str(data, "workspace_id", workspace_obj.id),
-                        name=_get_str(data, "name"),
-                        is_private=_get_int(data, "is_private"),
-                        channel_type=_get_str(data, "channel_type", "public"),
-                        topic=_get_str(data, "topic"),
-                    )
+            channels = (
+                Channel(
+                    id=_get_str(data, "id"),
+                    workspace_id=_get_str(data, "workspace_id", workspace_obj.id),
+                    name=_get_str(data, "name"),
+                    is_private=_get_int(data, "is_private"),
+                    channel_type=_get_str(data, "channel_type", "public"),
+                    topic=_get_str(data, "topic"),
                 )
-                if len(buffer) >= batch_size:
-                    store.insert_channels(buffer, ignore=ignore)
-                    buffer = []
-            if buffer:
-                store.insert_channels(buffer, ignore=ignore)
+                for data in _rows(path)
+            )
+            for batch in iter_batches(channels, batch_size):
+                store.insert_channels(batch, ignore=ignore)
 
         def _import_channel_members(path: Path) -> None:
             if not path.exists():
                 return
-            buffer: list[ChannelMember] = []
-            for row in load_jsonl(str(path)):
-                data = row if isinstance(row, dict) else {}
-                buffer.append(
-                    ChannelMember(
-                        channel_id=_get_str(data, "channel_id"),
-                        workspace_id=_get_str(data, "workspace_id", workspace_obj.id),
-                        user_id=_get_str(data, "user_id"),
-                    )
+            channel_members = (
+                ChannelMember(
+                    channel_id=_get_str(data, "channel_id"),
+                    workspace_id=_get_str(data, "workspace_id", workspace_obj.id),
+                    user_id=_get_str(data, "user_id"),
                 )
-                if len(buffer) >= batch_size:
-                    store.insert_channel_members(buffer)
-                    buffer = []
-            if buffer:
-                store.insert_channel_members(buffer)
+                for data in _rows(path)
+            )
+            for batch in iter_batches(channel_members, batch_size):
+                store.insert_channel_members(batch)
 
         def _import_messages(path: Path) -> None:
-            buffer: list[Message] = []
-            for row in load_jsonl(str(path)):
-                data = row if isinstance(row, dict) else {}
-                buffer.append(
-                    Message(
-                        id=_get_str(data, "id"),
-                        workspace_id=_get_str(data, "workspace_id", workspace_obj.id),
-                        channel_id=_get_str(data, "channel_id"),
-                        user_id=_get_str(data, "user_id"),
-                        ts=_get_int(data, "ts"),
-                        text=_get_str(data, "text"),
-                        thread_ts=_get_optional_int(data, "thread_ts"),
-                        reply_count=_get_int(data, "reply_count"),
-                        reactions_json=_get_str(data, "reactions_json"),
-                    )
+            messages = (
+                Message(
+                    id=_get_str(data, "id"),
+                    workspace_id=_get_str(data, "workspace_id", workspace_obj.id),
+                    channel_id=_get_str(data, "channel_id"),
+                    user_id=_get_str(data, "user_id"),
+                    ts=_get_int(data, "ts"),
+                    text=_get_str(data, "text"),
+                    thread_ts=_get_optional_int(data, "thread_ts"),
+                    reply_count=_get_int(data, "reply_count"),
+                    reactions_json=_get_str(data, "reactions_json"),
                 )
-                if len(buffer) >= batch_size:
-                    store.insert_messages(buffer, ignore=ignore)
-                    buffer = []
-            if buffer:
-                store.insert_messages(buffer, ignore=ignore)
+                for data in _rows(path)
+            )
+            for batch in iter_batches(messages, batch_size):
+                store.insert_messages(batch, ignore=ignore)
 
         def _import_files(path: Path) -> None:
-            buffer: list[File] = []
-            for row in load_jsonl(str(path)):
-                data = row if isinstance(row, dict) else {}
-                buffer.append(
-                    File(
-                        id=_get_str(data, "id"),
-                        workspace_id=_get_str(data, "workspace_id", workspace_obj.id),
-                        user_id=_get_str(data, "user_id"),
-                        name=_get_str(data, "name"),
-                        size=_get_int(data, "size"),
-                        mimetype=_get_str(data, "mimetype"),
-                        created_ts=_get_int(data, "created_ts"),
-                        channel_id=_get_str(data, "channel_id"),
-                        message_id=_get_str(data, "message_id") if data.get("message_id") else None,
-                        url=_get_str(data, "url"),
-                    )
+            files = (
+                File(
+                    id=_get_str(data, "id"),
+                    workspace_id=_get_str(data, "workspace_id", workspace_obj.id),
+                    user_id=_get_str(data, "user_id"),
+                    name=_get_str(data, "name"),
+                    size=_get_int(data, "size"),
+                    mimetype=_get_str(data, "mimetype"),
+                    created_ts=_get_int(data, "created_ts"),
+                    channel_id=_get_str(data, "channel_id"),
+                    message_id=_get_str(data, "message_id") if data.get("message_id") else None,
+                    url=_get_str(data, "url"),
                 )
-                if len(buffer) >= batch_size:
-                    store.insert_files(buffer, ignore=ignore)
-                    buffer = []
-            if buffer:
-                store.insert_files(buffer, ignore=ignore)
+                for data in _rows(path)
+            )
+            for batch in iter_batches(files, batch_size):
+                store.insert_files(batch, ignore=ignore)
 
         def _pick(path: Path, stem: str) -> Path:
             gz = path / f"{stem}.jsonl.gz"
@@ -878,11 +866,18 @@ def import_jsonl(
                 return gz
             return path / f"{stem}.jsonl"
 
-        _import_users(_pick(export_dir, "users"))
-        _import_channels(_pick(export_dir, "channels"))
-        _import_channel_members(_pick(export_dir, "channel_members"))
-        _import_messages(_pick(export_dir, "messages"))
-        _import_files(_pick(export_dir, "files"))
+        # One transaction for the whole import: a single commit, and a failed import
+        # (e.g. a row missing a required field) leaves the DB untouched.
+        with store.transaction():
+            store.insert_workspace(workspace_obj, ignore=ignore)
+            if meta:
+                store.set_workspace_meta(workspace_obj.id, meta)
+            _import_users(_pick(export_dir, "users"))
+            _import_channels(_pick(export_dir, "channels"))
+            _import_channel_members(_pick(export_dir, "channel_members"))
+            _import_messages(_pick(export_dir, "messages"))
+            _import_files(_pick(export_dir, "files"))
+        store.optimize()
 
         typer.echo(f"Imported workspace {workspace_obj.id} into {db}")
     finally:
@@ -1328,15 +1323,9 @@ def seed_import(
                 msg_payload["thread_ts"] = f"{thread_ts_value}.000000"
             reactions_raw = message.get("reactions_json")
             if isinstance(reactions_raw, str):
-                try:
-                    reactions_payload = json.loads(reactions_raw)
-                    if isinstance(reactions_payload, dict):
-                        msg_payload["reactions"] = [
-                            {"name": name, "count": int(count), "users": []}
-                            for name, count in reactions_payload.items()
-                        ]
-                except json.JSONDecodeError:
-                    pass
+                reactions = _slack_reactions(reactions_raw)
+                if reactions is not None:
+                    msg_payload["reactions"] = reactions
             buffer.append(msg_payload)
             messages_written += 1
 
@@ -1768,7 +1757,7 @@ def seed_live(
 
             posted += 1
             if delay:
-                time.sleep(delay)
+                _sleep(delay)
 
         stats = {
             "workspace_id": resolved_workspace_id,
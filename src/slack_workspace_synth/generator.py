@@ -3,16 +3,20 @@ from __future__ import annotations
 import hashlib
 import json
 import random
-import uuid
-from collections.abc import Iterable
+import re
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
-from typing import cast
+from functools import partial
+from itertools import islice
+from typing import Any, TypeVar
 
 from faker import Faker
 
 from .models import Channel, ChannelMember, File, Message, User, Workspace
 from .plugins import PluginRegistry
 
+T = TypeVar("T")
+
 
 @dataclass
 class GenerationConfig:
@@ -61,17 +65,91 @@ def _workspace_id_namespace(config: GenerationConfig) -> str:
     )
 
 
+# Clear the version/variant nibbles, then set version 4 and the RFC 4122 variant.
+_UUID4_MASK = ~((0xF000 << 64) | (0xC000 << 48)) & ((1 << 128) - 1)
+_UUID4_BITS = (0x4000 << 64) | (0x8000 << 48)
+
+
 def _seeded_uuid(rng: random.Random) -> str:
-    # UUID v4 shape with deterministic bits from the seeded RNG.
-    return uuid.UUID(int=rng.getrandbits(128), version=4).hex
+    # UUID v4 shape with deterministic bits from the seeded RNG; formatted directly
+    # instead of via uuid.UUID to skip per-id object construction.
+    return f"{rng.getrandbits(128) & _UUID4_MASK | _UUID4_BITS:032x}"
+
+
+# Activity timestamps are spread over the 30 days before the workspace base timestamp.
+_TS_SPREAD_SECONDS = 60 * 60 * 24 * 30
+
+# Reaction payloads only vary by a small count, so serialize each variant once.
+_REACTIONS_JSON = tuple(json.dumps({"thumbsup": count}) for count in range(6))
+
+_FILE_EXTENSIONS = ("pdf", "png", "txt", "zip")
+_FILE_MIME_TYPES = ("application/pdf", "image/png", "text/plain", "application/zip")
+_FILE_URL_PREFIX = "https://files.example.com/"
 
 
 def _base_ts(seed: int) -> int:
     return 1_700_000_000 + (seed % 10_000) * 100
 
 
+def iter_batches(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    # Chunk a record stream into insert-sized lists; islice fills each list in C
+    # rather than through a per-record append/len check in the caller.
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+# Strips everything but alphanumerics and "-". In Unicode mode \w is str.isalnum()
+# plus "_", so this keeps exactly the characters a per-char isalnum() filter keeps.
+_SLUG_STRIP_RE = re.compile(r"[^\w-]|_")
+
+
 def _slug(text: str) -> str:
-    return "".join(c for c in text.lower().replace(" ", "-") if c.isalnum() or c == "-")
+    return _SLUG_STRIP_RE.sub("", text.lower().replace(" ", "-"))
+
+
+def _word_sampler(faker: Faker) -> Callable[[], str]:
+    # Same single choice() Faker's lorem ``word()`` makes, without copying the word
+    # list on every call.
+    try:
+        faker_rng = faker.random
+    except NotImplementedError:
+        return faker.word
+    return partial(faker_rng.choice, tuple(faker.get_words_list()))
+
+
+def _sentence_sampler(faker: Faker) -> Callable[[int], str]:
+    # Reproduces Faker's lorem ``sentence(nb_words=n)`` draw-for-draw (same word
+    # pool, same calls on the same Random, the locale's word connector and closing
+    # punctuation), minus the provider dispatch and the two word-list copies Faker
+    # makes per call. Multi-locale proxies have no single Random to draw from, and
+    # lorem providers without those attributes can't be mirrored, so both keep going
+    # through faker.sentence.
+    def fallback(nb_words: int) -> str:
+        return faker.sentence(nb_words=nb_words)
+
+    try:
+        faker_rng = faker.random
+    except NotImplementedError:
+        return fallback
+    lorem = getattr(faker.sentence, "__self__", None)
+    connector = getattr(lorem, "word_connector", None)
+    punctuation = getattr(lorem, "sentence_punctuation", None)
+    if not isinstance(connector, str) or not isinstance(punctuation, str):
+        return fallback
+    join = connector.join
+    pool = tuple(faker.get_words_list())
+    randint = faker_rng.randint
+    choice = faker_rng.choice
+    choices = faker_rng.choices
+
+    def sentence(nb_words: int) -> str:
+        count = max(1, int(nb_words * randint(60, 140) / 100))
+        words = choices(pool, k=count) if count > 1 else [choice(pool)]
+        words[0] = words[0].title()
+        return join(words) + punctuation
+
+    return sentence
 
 
 def generate_workspace(
@@ -86,12 +164,16 @@ def generate_workspace(
         "workspace",
         namespace=_workspace_id_namespace(config),
     )
-    payload = {"id": _seeded_uuid(ids), "name": config.workspace_name, "created_at": ts}
+    payload: dict[str, Any] = {
+        "id": _seeded_uuid(ids),
+        "name": config.workspace_name,
+        "created_at": ts,
+    }
     payload = plugins.on_workspace(payload)
     return Workspace(
-        id=cast(str, payload["id"]),
-        name=cast(str, payload["name"]),
-        created_at=cast(int, payload["created_at"]),
+        id=payload["id"],
+        name=payload["name"],
+        created_at=payload["created_at"],
     )
 
 
@@ -109,7 +191,7 @@ def generate_users(
     for idx in range(config.users):
         name = faker.name()
         email = f"{_slug(name)}.{idx}@example.com"
-        payload = {
+        payload: dict[str, Any] = {
             "id": _seeded_uuid(ids),
             "workspace_id": workspace_id,
             "name": name,
@@ -120,12 +202,12 @@ def generate_users(
         payload = plugins.on_user(payload)
         users.append(
             User(
-                id=cast(str, payload["id"]),
-                workspace_id=cast(str, payload["workspace_id"]),
-                name=cast(str, payload["name"]),
-                email=cast(str, payload["email"]),
-                title=cast(str, payload["title"]),
-                is_bot=cast(int, payload["is_bot"]),
+                id=payload["id"],
+                workspace_id=payload["workspace_id"],
+                name=payload["name"],
+                email=payload["email"],
+                title=payload["title"],
+                is_bot=payload["is_bot"],
             )
         )
     return users
@@ -146,7 +228,7 @@ def generate_channels(
         base = faker.word().replace("_", "-")
         name = f"{base}-{idx}" if idx > 0 else base
         is_private = 1 if rng.random() < 0.15 else 0
-        payload = {
+        payload: dict[str, Any] = {
             "id": _seeded_uuid(ids),
             "workspace_id": workspace_id,
             "name": name,
@@ -157,12 +239,12 @@ def generate_channels(
         payload = plugins.on_channel(payload)
         channels.append(
             Channel(
-                id=cast(str, payload["id"]),
-                workspace_id=cast(str, payload["workspace_id"]),
-                name=cast(str, payload["name"]),
-                is_private=cast(int, payload["is_private"]),
-                channel_type=cast(str, payload["channel_type"]),
-                topic=cast(str, payload["topic"]),
+                id=payload["id"],
+                workspace_id=payload["workspace_id"],
+                name=payload["name"],
+                is_private=payload["is_private"],
+                channel_type=payload["channel_type"],
+                topic=payload["topic"],
             )
         )
     for idx in range(config.dm_channels):
@@ -177,12 +259,12 @@ def generate_channels(
         payload = plugins.on_channel(payload)
         channels.append(
             Channel(
-                id=cast(str, payload["id"]),
-                workspace_id=cast(str, payload["workspace_id"]),
-                name=cast(str, payload["name"]),
-                is_private=cast(int, payload["is_private"]),
-                channel_type=cast(str, payload["channel_type"]),
-                topic=cast(str, payload["topic"]),
+                id=payload["id"],
+                workspace_id=payload["workspace_id"],
+                name=payload["name"],
+                is_private=payload["is_private"],
+                channel_type=payload["channel_type"],
+                topic=payload["topic"],
             )
         )
     for idx in range(config.mpdm_channels):
@@ -197,12 +279,12 @@ def generate_channels(
         payload = plugins.on_channel(payload)
         channels.append(
             Channel(
-                id=cast(str, payload["id"]),
-                workspace_id=cast(str, payload["workspace_id"]),
-                name=cast(str, payload["name"]),
-                is_private=cast(int, payload["is_private"]),
-                channel_type=cast(str, payload["channel_type"]),
-                topic=cast(str, payload["topic"]),
+                id=payload["id"],
+                workspace_id=payload["workspace_id"],
+                name=payload["name"],
+                is_private=payload["is_private"],
+                channel_type=payload["channel_type"],
+                topic=payload["topic"],
             )
         )
     return channels
@@ -268,30 +350,51 @@ def generate_messages(
 ) -> Iterable[Message]:
     ids = id_rng or _id_rng(config.seed, "messages", namespace=workspace_id)
     base_ts = _base_ts(config.seed)
+    # Bound-method locals keep the per-record draws off attribute lookups, and
+    # randrange(a, b + 1) is exactly what randint(a, b) draws, minus a call layer.
+    # The draw order (and so the seeded output) is unchanged.
+    choice = rng.choice
+    randrange = rng.randrange
+    sentence = _sentence_sampler(faker)
+    if not plugins.message_hooks:
+        # No hooks registered: build records directly, with no payload dict or hook
+        # dispatch and no per-record hooks check.
+        for _ in range(config.messages):
+            yield Message(
+                id=_seeded_uuid(ids),
+                workspace_id=workspace_id,
+                channel_id=choice(channel_ids),
+                user_id=choice(user_ids),
+                ts=base_ts - randrange(_TS_SPREAD_SECONDS + 1),
+                text=sentence(randrange(4, 21)),
+                thread_ts=None,
+                reply_count=randrange(7),
+                reactions_json=_REACTIONS_JSON[randrange(6)],
+            )
+        return
     for _ in range(config.messages):
-        payload = {
+        payload: dict[str, Any] = {
             "id": _seeded_uuid(ids),
             "workspace_id": workspace_id,
-            "channel_id": rng.choice(channel_ids),
-            "user_id": rng.choice(user_ids),
-            "ts": base_ts - rng.randint(0, 60 * 60 * 24 * 30),
-            "text": faker.sentence(nb_words=rng.randint(4, 20)),
+            "channel_id": choice(channel_ids),
+            "user_id": choice(user_ids),
+            "ts": base_ts - randrange(_TS_SPREAD_SECONDS + 1),
+            "text": sentence(randrange(4, 21)),
             "thread_ts": None,
-            "reply_count": rng.randint(0, 6),
-            "reactions_json": json.dumps({"thumbsup": rng.randint(0, 5)}),
+            "reply_count": randrange(7),
+            "reactions_json": _REACTIONS_JSON[randrange(6)],
         }
         payload = plugins.on_message(payload)
-        thread_ts = cast(int | None, payload.get("thread_ts"))
         yield Message(
-            id=cast(str, payload["id"]),
-            workspace_id=cast(str, payload["workspace_id"]),
-            channel_id=cast(str, payload["channel_id"]),
-            user_id=cast(str, payload["user_id"]),
-            ts=cast(int, payload["ts"]),
-            text=cast(str, payload["text"]),
-            thread_ts=thread_ts,
-            reply_count=cast(int, payload["reply_count"]),
-            reactions_json=cast(str, payload["reactions_json"]),
+            id=payload["id"],
+            workspace_id=payload["workspace_id"],
+            channel_id=payload["channel_id"],
+            user_id=payload["user_id"],
+            ts=payload["ts"],
+            text=payload["text"],
+            thread_ts=payload.get("thread_ts"),
+            reply_count=payload["reply_count"],
+            reactions_json=payload["reactions_json"],
         )
 
 
@@ -307,32 +410,48 @@ def generate_files(
     id_rng: random.Random | None = None,
 ) -> Iterable[File]:
     ids = id_rng or _id_rng(config.seed, "files", namespace=workspace_id)
-    mime_types = ["application/pdf", "image/png", "text/plain", "application/zip"]
     base_ts = _base_ts(config.seed)
+    choice = rng.choice
+    randrange = rng.randrange
+    word = _word_sampler(faker)
+    if not plugins.file_hooks:
+        for _ in range(config.files):
+            yield File(
+                id=_seeded_uuid(ids),
+                workspace_id=workspace_id,
+                user_id=choice(user_ids),
+                name=f"{word()}.{choice(_FILE_EXTENSIONS)}",
+                size=randrange(5_000, 5_000_001),
+                mimetype=choice(_FILE_MIME_TYPES),
+                created_ts=base_ts - randrange(_TS_SPREAD_SECONDS + 1),
+                channel_id=choice(channel_ids),
+                message_id=None,
+                url=_FILE_URL_PREFIX + _seeded_uuid(ids),
+            )
+        return
     for _ in range(config.files):
-        payload = {
+        payload: dict[str, Any] = {
             "id": _seeded_uuid(ids),
             "workspace_id": workspace_id,
-            "user_id": rng.choice(user_ids),
-            "name": f"{faker.word()}.{rng.choice(['pdf', 'png', 'txt', 'zip'])}",
-            "size": rng.randint(5_000, 5_000_000),
-            "mimetype": rng.choice(mime_types),
-            "created_ts": base_ts - rng.randint(0, 60 * 60 * 24 * 30),
-            "channel_id": rng.choice(channel_ids),
+            "user_id": choice(user_ids),
+            "name": f"{word()}.{choice(_FILE_EXTENSIONS)}",
+            "size": randrange(5_000, 5_000_001),
+            "mimetype": choice(_FILE_MIME_TYPES),
+            "created_ts": base_ts - randrange(_TS_SPREAD_SECONDS + 1),
+            "channel_id": choice(channel_ids),
             "message_id": None,
-            "url": f"https://files.example.com/{_seeded_uuid(ids)}",
+            "url": _FILE_URL_PREFIX + _seeded_uuid(ids),
         }
         payload = plugins.on_file(payload)
-        message_id = cast(str | None, payload.get("message_id"))
         yield File(
-            id=cast(str, payload["id"]),
-            workspace_id=cast(str, payload["workspace_id"]),
-            user_id=cast(str, payload["user_id"]),
-            name=cast(str, payload["name"]),
-            size=cast(int, payload["size"]),
-            mimetype=cast(str, payload["mimetype"]),
-            created_ts=cast(int, payload["created_ts"]),
-            channel_id=cast(str, payload["channel_id"]),
-            message_id=message_id,
-            url=cast(str, payload["url"]),
+            id=payload["id"],
+            workspace_id=payload["workspace_id"],
+            user_id=payload["user_id"],
+            name=payload["name"],
+            size=payload["size"],
+            mimetype=payload["mimetype"],
+            created_ts=payload["created_ts"],
+            channel_id=payload["channel_id"],
+            message_id=payload.get("message_id"),
+            url=payload["url"],
         )
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Workspace:
     id: str
     name: str
@@ -14,7 +14,7 @@ class Workspace:
         return {"id": self.id, "name": self.name, "created_at": self.created_at}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class User:
     id: str
     workspace_id: str
@@ -34,7 +34,7 @@ class User:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Channel:
     id: str
     workspace_id: str
@@ -54,7 +54,7 @@ class Channel:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Message:
     id: str
     workspace_id: str
@@ -80,7 +80,7 @@ class Message:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class File:
     id: str
     workspace_id: str
@@ -108,7 +108,7 @@ class File:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChannelMember:
     channel_id: str
     workspace_id: str
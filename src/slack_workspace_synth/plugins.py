@@ -17,6 +17,8 @@ class PluginRegistry:
     file_hooks: list[Hook] = field(default_factory=list)
 
     def apply(self, hooks: Iterable[Hook], payload: dict[str, Any]) -> dict[str, Any]:
+        if not hooks:
+            return payload
         result = payload
         for hook in hooks:
             result = hook(result)
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+from faker import Faker
+
+from slack_workspace_synth.generator import (
+    GenerationConfig,
+    generate_channels,
+    generate_files,
+    generate_messages,
+    generate_users,
+    generate_workspace,
+)
+from slack_workspace_synth.plugins import PluginRegistry
+from slack_workspace_synth.storage import SQLiteStore
+
+
+@pytest.fixture(scope="session")
+def seeded_db(tmp_path_factory) -> tuple[str, str]:
+    # Built once per session; tests that open it read-write should copy it into tmp_path first.
+    db_path = tmp_path_factory.mktemp("seeded") / "demo.db"
+    config = GenerationConfig(
+        workspace_name="Test",
+        users=5,
+        channels=3,
+        dm_channels=0,
+        mpdm_channels=0,
+        messages=10,
+        files=6,
+        seed=123,
+        batch_size=50,
+    )
+    plugins = PluginRegistry()
+
+    store = SQLiteStore(str(db_path))
+    try:
+        with store.transaction():
+            workspace = generate_workspace(config, plugins)
+            store.insert_workspace(workspace)
+
+            rng = random.Random(123)
+            faker = Faker()
+            faker.seed_instance(123)
+
+            users = generate_users(config, workspace.id, rng, faker, plugins)
+            channels = generate_channels(config, workspace.id, rng, faker, plugins)
+            store.insert_users(users)
+            store.insert_channels(channels)
+
+            user_ids = [u.id for u in users]
+            channel_ids = [c.id for c in channels]
+
+            store.insert_messages(
+                generate_messages(config, workspace.id, user_ids, channel_ids, rng, faker, plugins)
+            )
+            store.insert_files(
+                generate_files(config, workspace.id, user_ids, channel_ids, rng, faker, plugins)
+            )
+    finally:
+        store.close()
+
+    return str(db_path), workspace.id
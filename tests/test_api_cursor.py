@@ -1,174 +1,125 @@
-import random
+import os
+import shutil
+from collections.abc import Iterator
 
-from faker import Faker
+import pytest
 from fastapi.testclient import TestClient
 
+from slack_workspace_synth import api
 from slack_workspace_synth.api import app
-from slack_workspace_synth.generator import (
-    GenerationConfig,
-    generate_channels,
-    generate_files,
-    generate_messages,
-    generate_users,
-    generate_workspace,
-)
-from slack_workspace_synth.plugins import PluginRegistry
-from slack_workspace_synth.storage import SQLiteStore
-
-
-def _seed_db(tmp_path) -> tuple[str, str]:
-    db_path = tmp_path / "demo.db"
-    config = GenerationConfig(
-        workspace_name="Test",
-        users=5,
-        channels=3,
-        dm_channels=0,
-        mpdm_channels=0,
-        messages=10,
-        files=6,
-        seed=123,
-        batch_size=50,
-    )
-    plugins = PluginRegistry()
-
-    store = SQLiteStore(str(db_path))
-    try:
-        workspace = generate_workspace(config, plugins)
-        store.insert_workspace(workspace)
-
-        rng = random.Random(123)
-        faker = Faker()
-        faker.seed_instance(123)
-
-        users = generate_users(config, workspace.id, rng, faker, plugins)
-        channels = generate_channels(config, workspace.id, rng, faker, plugins)
-        store.insert_users(users)
-        store.insert_channels(channels)
-
-        user_ids = [u.id for u in users]
-        channel_ids = [c.id for c in channels]
-
-        store.insert_messages(
-            list(
-                generate_messages(config, workspace.id, user_ids, channel_ids, rng, faker, plugins)
-            )
-        )
-        store.insert_files(
-            list(generate_files(config, workspace.id, user_ids, channel_ids, rng, faker, plugins))
-        )
-    finally:
-        store.close()
 
-    return str(db_path), workspace.id
 
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
+    # One client (and app lifespan) for the module; SWSYNTH_DB is read per request.
+    with TestClient(app) as test_client:
+        yield test_client
 
-def test_messages_cursor_pagination(tmp_path, monkeypatch):
-    db_path, workspace_id = _seed_db(tmp_path)
-    monkeypatch.setenv("SWSYNTH_DB", db_path)
-    client = TestClient(app)
 
-    r1 = client.get(f"/workspaces/{workspace_id}/messages", params={"cursor": "", "limit": 3})
-    assert r1.status_code == 200
-    page1 = r1.json()
-    assert len(page1) == 3
-    cursor = r1.headers.get("x-next-cursor")
-    assert cursor
-
-    r2 = client.get(f"/workspaces/{workspace_id}/messages", params={"cursor": cursor, "limit": 3})
-    assert r2.status_code == 200
-    page2 = r2.json()
-    assert len(page2) == 3
-    assert {m["id"] for m in page1}.isdisjoint({m["id"] for m in page2})
-
-    r_bad = client.get(f"/workspaces/{workspace_id}/messages", params={"cursor": "not-a-cursor"})
-    assert r_bad.status_code == 400
-
-    r_both = client.get(
-        f"/workspaces/{workspace_id}/messages", params={"cursor": "", "offset": 10, "limit": 3}
-    )
-    assert r_both.status_code == 400
-
-
-def test_files_cursor_pagination(tmp_path, monkeypatch):
-    db_path, workspace_id = _seed_db(tmp_path)
+def test_first_page_returns_cursor_and_offset_pages_line_up(client, seeded_db, monkeypatch):
+    db_path, workspace_id = seeded_db
     monkeypatch.setenv("SWSYNTH_DB", db_path)
-    client = TestClient(app)
-
-    r1 = client.get(f"/workspaces/{workspace_id}/files", params={"cursor": "", "limit": 2})
-    assert r1.status_code == 200
-    page1 = r1.json()
-    assert len(page1) == 2
-    cursor = r1.headers.get("x-next-cursor")
-    assert cursor
 
-    r2 = client.get(f"/workspaces/{workspace_id}/files", params={"cursor": cursor, "limit": 2})
-    assert r2.status_code == 200
-    page2 = r2.json()
-    assert len(page2) == 2
-    assert {f["id"] for f in page1}.isdisjoint({f["id"] for f in page2})
+    for resource in ("users", "channels", "messages", "files"):
+        url = f"/workspaces/{workspace_id}/{resource}"
+        first = client.get(url, params={"limit": 2})
+        assert first.status_code == 200
+        cursor = first.headers.get("x-next-cursor")
+        assert cursor
 
-    r_both = client.get(
-        f"/workspaces/{workspace_id}/files", params={"cursor": "", "offset": 10, "limit": 2}
-    )
-    assert r_both.status_code == 400
+        by_cursor = client.get(url, params={"cursor": cursor, "limit": 2}).json()
+        by_offset = client.get(url, params={"offset": 2, "limit": 2}).json()
+        assert by_offset == by_cursor
 
 
-def test_users_cursor_pagination(tmp_path, monkeypatch):
-    db_path, workspace_id = _seed_db(tmp_path)
+@pytest.mark.parametrize(
+    ("resource", "limit", "second_page_len"),
+    [("messages", 3, 3), ("files", 2, 2), ("users", 2, 2), ("channels", 2, 1)],
+)
+def test_cursor_pagination(client, seeded_db, monkeypatch, resource, limit, second_page_len):
+    db_path, workspace_id = seeded_db
     monkeypatch.setenv("SWSYNTH_DB", db_path)
-    client = TestClient(app)
+    url = f"/workspaces/{workspace_id}/{resource}"
 
-    r1 = client.get(f"/workspaces/{workspace_id}/users", params={"cursor": "", "limit": 2})
+    r1 = client.get(url, params={"cursor": "", "limit": limit})
     assert r1.status_code == 200
     page1 = r1.json()
-    assert len(page1) == 2
+    assert len(page1) == limit
     cursor = r1.headers.get("x-next-cursor")
     assert cursor
 
-    r2 = client.get(f"/workspaces/{workspace_id}/users", params={"cursor": cursor, "limit": 2})
+    r2 = client.get(url, params={"cursor": cursor, "limit": limit})
     assert r2.status_code == 200
     page2 = r2.json()
-    assert len(page2) == 2
-    assert {u["id"] for u in page1}.isdisjoint({u["id"] for u in page2})
-
-    r_bad = client.get(f"/workspaces/{workspace_id}/users", params={"cursor": "not-a-cursor"})
-    assert r_bad.status_code == 400
+    assert len(page2) == second_page_len
+    assert {row["id"] for row in page1}.isdisjoint({row["id"] for row in page2})
 
-    r_both = client.get(
-        f"/workspaces/{workspace_id}/users", params={"cursor": "", "offset": 10, "limit": 2}
-    )
-    assert r_both.status_code == 400
 
-
-def test_channels_cursor_pagination(tmp_path, monkeypatch):
-    db_path, workspace_id = _seed_db(tmp_path)
+@pytest.mark.parametrize("resource", ["messages", "files", "users", "channels"])
+@pytest.mark.parametrize(
+    "params",
+    [{"cursor": "not-a-cursor"}, {"cursor": "", "offset": 10, "limit": 2}],
+    ids=["bad-cursor", "cursor-and-offset"],
+)
+def test_cursor_rejections(client, seeded_db, monkeypatch, resource, params):
+    db_path, workspace_id = seeded_db
     monkeypatch.setenv("SWSYNTH_DB", db_path)
-    client = TestClient(app)
 
-    r1 = client.get(f"/workspaces/{workspace_id}/channels", params={"cursor": "", "limit": 2})
-    assert r1.status_code == 200
-    page1 = r1.json()
-    assert len(page1) == 2
-    cursor = r1.headers.get("x-next-cursor")
-    assert cursor
-
-    r2 = client.get(f"/workspaces/{workspace_id}/channels", params={"cursor": cursor, "limit": 2})
-    assert r2.status_code == 200
-    page2 = r2.json()
-    assert len(page2) == 1
-    assert {c["id"] for c in page1}.isdisjoint({c["id"] for c in page2})
-
-    r_both = client.get(
-        f"/workspaces/{workspace_id}/channels", params={"cursor": "", "offset": 10, "limit": 2}
-    )
-    assert r_both.status_code == 400
+    resp = client.get(f"/workspaces/{workspace_id}/{resource}", params=params)
+    assert resp.status_code == 400
 
 
-def test_api_returns_400_for_missing_db_path(tmp_path, monkeypatch):
+def test_api_returns_400_for_missing_db_path(client, tmp_path, monkeypatch):
     missing = tmp_path / "missing.db"
     monkeypatch.setenv("SWSYNTH_DB", str(missing))
-    client = TestClient(app)
 
     resp = client.get("/workspaces")
     assert resp.status_code == 400
     assert not missing.exists()
+
+
+def test_api_reuses_pooled_read_only_store(client, seeded_db, monkeypatch):
+    db_path, workspace_id = seeded_db
+    monkeypatch.setenv("SWSYNTH_DB", db_path)
+    try:
+        assert client.get(f"/workspaces/{workspace_id}/users").status_code == 200
+        pool = api._pools[os.path.realpath(db_path)][1]
+        assert pool.qsize() == 1
+        assert client.get(f"/workspaces/{workspace_id}/channels").status_code == 200
+        assert pool.qsize() == 1
+    finally:
+        api.close_store_pools()
+    assert not api._pools
+
+
+def test_api_store_pools_are_normalized_bounded_and_dropped(
+    client, seeded_db, tmp_path, monkeypatch
+):
+    source_db, _ = seeded_db
+    first = tmp_path / "first.db"
+    second = tmp_path / "second.db"
+    shutil.copyfile(source_db, first)
+    shutil.copyfile(source_db, second)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(api, "_MAX_POOLS", 1)
+    try:
+        # Spellings of the same file share one pool.
+        for db in (str(first), "first.db", "./first.db"):
+            assert client.get("/workspaces", params={"db": db}).status_code == 200
+        assert list(api._pools) == [os.path.realpath(first)]
+        first_pool = api._pools[os.path.realpath(first)][1]
+        assert first_pool.qsize() == 1
+
+        # A new path over the cap evicts (and closes) the least recently used pool.
+        assert client.get("/workspaces", params={"db": str(second)}).status_code == 200
+        assert list(api._pools) == [os.path.realpath(second)]
+        assert first_pool.qsize() == 0
+
+        # A DB that disappears from disk loses its pool and pooled connections.
+        second_pool = api._pools[os.path.realpath(second)][1]
+        second.unlink()
+        assert client.get("/workspaces", params={"db": str(second)}).status_code == 400
+        assert not api._pools
+        assert second_pool.qsize() == 0
+    finally:
+        api.close_store_pools()
@@ -40,16 +40,17 @@ def test_channel_map_offline(tmp_path: Path) -> None:
     try:
         workspace_id = store.latest_workspace_id()
         assert workspace_id
-        channels = list(store.iter_channels(workspace_id, chunk_size=100))
+        slack_channels_payload = {
+            "channels": [
+                {"id": f"C{idx:03d}", "name": str(channel["name"])}
+                for idx, channel in enumerate(
+                    store.iter_channels(workspace_id, chunk_size=100), start=1
+                )
+            ]
+        }
     finally:
         store.close()
 
-    slack_channels_payload = {
-        "channels": [
-            {"id": f"C{idx:03d}", "name": str(channel["name"])}
-            for idx, channel in enumerate(channels, start=1)
-        ]
-    }
     slack_channels_path.write_text(json.dumps(slack_channels_payload), encoding="utf-8")
 
     mapping = runner.invoke(
@@ -101,14 +102,15 @@ def test_channel_map_offline_top_level_list(tmp_path: Path) -> None:
     try:
         workspace_id = store.latest_workspace_id()
         assert workspace_id
-        channels = list(store.iter_channels(workspace_id, chunk_size=100))
+        slack_channels_payload = [
+            {"id": f"C{idx:03d}", "name": str(channel["name"])}
+            for idx, channel in enumerate(
+                store.iter_channels(workspace_id, chunk_size=100), start=1
+            )
+        ]
     finally:
         store.close()
 
-    slack_channels_payload = [
-        {"id": f"C{idx:03d}", "name": str(channel["name"])}
-        for idx, channel in enumerate(channels, start=1)
-    ]
     slack_channels_path.write_text(json.dumps(slack_channels_payload), encoding="utf-8")
 
     mapping = runner.invoke(
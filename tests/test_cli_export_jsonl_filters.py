@@ -10,10 +10,7 @@ runner = CliRunner()
 
 
 def _count_lines(path: Path) -> int:
-    data = path.read_text(encoding="utf-8")
-    if not data:
-        return 0
-    return len([line for line in data.splitlines() if line.strip()])
+    return sum(1 for line in path.read_bytes().splitlines() if line.strip())
 
 
 def test_export_jsonl_after_ts_filters_messages_and_files(tmp_path: Path) -> None:
@@ -47,17 +44,13 @@ def test_export_jsonl_after_ts_filters_messages_and_files(tmp_path: Path) -> Non
         assert row
         workspace_id = str(row[0])
 
-        max_message_ts_row = conn.execute(
-            "SELECT MAX(ts) FROM messages WHERE workspace_id = ?", (workspace_id,)
+        max_message_ts, max_file_ts = conn.execute(
+            "SELECT (SELECT MAX(ts) FROM messages WHERE workspace_id = ?1),"
+            " (SELECT MAX(created_ts) FROM files WHERE workspace_id = ?1)",
+            (workspace_id,),
         ).fetchone()
-        max_file_ts_row = conn.execute(
-            "SELECT MAX(created_ts) FROM files WHERE workspace_id = ?", (workspace_id,)
-        ).fetchone()
-        assert max_message_ts_row and max_message_ts_row[0] is not None
-        assert max_file_ts_row and max_file_ts_row[0] is not None
-
-        max_message_ts = int(max_message_ts_row[0])
-        max_file_ts = int(max_file_ts_row[0])
+        assert max_message_ts is not None
+        assert max_file_ts is not None
 
     export = runner.invoke(
         app,
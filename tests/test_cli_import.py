@@ -1,10 +1,13 @@
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from slack_workspace_synth.cli import app
 from slack_workspace_synth.storage import SQLiteStore
 
+pytestmark = pytest.mark.slow
+
 runner = CliRunner()
 
 
@@ -42,26 +42,25 @@ def test_provision_slack_dry_run(tmp_path: Path) -> None:
     try:
         workspace_id = store.latest_workspace_id()
         assert workspace_id
-        users = list(store.iter_users(workspace_id, chunk_size=100))
-        channels = list(store.iter_channels(workspace_id, chunk_size=100))
+        tokens_payload = {
+            str(user["id"]): {
+                "slack_user_id": f"U{idx:08d}",
+                "access_token": f"xoxp-test-{idx}",
+            }
+            for idx, user in enumerate(store.iter_users(workspace_id, chunk_size=100), start=1)
+        }
+        slack_channels_payload = {
+            "channels": [
+                {"id": f"C{idx:08d}", "name": str(channel["name"])}
+                for idx, channel in enumerate(
+                    store.iter_channels(workspace_id, chunk_size=100), start=1
+                )
+            ]
+        }
     finally:
         store.close()
 
-    tokens_payload = {
-        str(user["id"]): {
-            "slack_user_id": f"U{idx:08d}",
-            "access_token": f"xoxp-test-{idx}",
-        }
-        for idx, user in enumerate(users, start=1)
-    }
     tokens_path.write_text(json.dumps(tokens_payload), encoding="utf-8")
-
-    slack_channels_payload = {
-        "channels": [
-            {"id": f"C{idx:08d}", "name": str(channel["name"])}
-            for idx, channel in enumerate(channels, start=1)
-        ]
-    }
     slack_channels_path.write_text(json.dumps(slack_channels_payload), encoding="utf-8")
 
     provision = runner.invoke(
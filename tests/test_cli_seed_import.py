@@ -2,10 +2,13 @@ import json
 import zipfile
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from slack_workspace_synth.cli import app
 
+pytestmark = pytest.mark.slow
+
 runner = CliRunner()
 
 
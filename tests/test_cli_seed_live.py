@@ -1,5 +1,6 @@
 import json
 import re
+from collections.abc import Iterable
 from pathlib import Path
 
 import pytest
@@ -10,6 +11,8 @@ from slack_workspace_synth.cli import app
 from slack_workspace_synth.models import Message
 from slack_workspace_synth.storage import SQLiteStore
 
+pytestmark = pytest.mark.slow
+
 runner = CliRunner()
 _ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
 
@@ -18,6 +21,17 @@ def _strip_ansi(text: str) -> str:
     return _ANSI_RE.sub("", text)
 
 
+def _write_tokens(path: Path, users: Iterable[dict[str, object]]) -> None:
+    tokens_payload = {
+        str(user["id"]): {
+            "slack_user_id": f"U{idx:08d}",
+            "access_token": f"xoxp-test-{idx}",
+        }
+        for idx, user in enumerate(users, start=1)
+    }
+    path.write_text(json.dumps(tokens_payload), encoding="utf-8")
+
+
 def test_seed_live_dry_run(tmp_path: Path) -> None:
     source_db = tmp_path / "source.db"
     report_path = tmp_path / "report.json"
@@ -54,26 +68,18 @@ def test_seed_live_dry_run(tmp_path: Path) -> None:
     try:
         workspace_id = store.latest_workspace_id()
         assert workspace_id
-        users = list(store.iter_users(workspace_id, chunk_size=100))
-        channels = list(store.iter_channels(workspace_id, chunk_size=100))
+        _write_tokens(tokens_path, store.iter_users(workspace_id, chunk_size=100))
+        slack_channels_payload = {
+            "channels": [
+                {"id": f"C{idx:08d}", "name": str(channel["name"])}
+                for idx, channel in enumerate(
+                    store.iter_channels(workspace_id, chunk_size=100), start=1
+                )
+            ]
+        }
     finally:
         store.close()
 
-    tokens_payload = {
-        str(user["id"]): {
-            "slack_user_id": f"U{idx:08d}",
-            "access_token": f"xoxp-test-{idx}",
-        }
-        for idx, user in enumerate(users, start=1)
-    }
-    tokens_path.write_text(json.dumps(tokens_payload), encoding="utf-8")
-
-    slack_channels_payload = {
-        "channels": [
-            {"id": f"C{idx:08d}", "name": str(channel["name"])}
-            for idx, channel in enumerate(channels, start=1)
-        ]
-    }
     slack_channels_path.write_text(json.dumps(slack_channels_payload), encoding="utf-8")
 
     seed = runner.invoke(
@@ -134,19 +140,10 @@ def test_seed_live_dry_run_requires_offline_mapping(tmp_path: Path) -> None:
     try:
         workspace_id = store.latest_workspace_id()
         assert workspace_id
-        users = list(store.iter_users(workspace_id, chunk_size=100))
+        _write_tokens(tokens_path, store.iter_users(workspace_id, chunk_size=100))
     finally:
         store.close()
 
-    tokens_payload = {
-        str(user["id"]): {
-            "slack_user_id": f"U{idx:08d}",
-            "access_token": f"xoxp-test-{idx}",
-        }
-        for idx, user in enumerate(users, start=1)
-    }
-    tokens_path.write_text(json.dumps(tokens_payload), encoding="utf-8")
-
     seed = runner.invoke(
         app,
         [
@@ -227,14 +224,7 @@ def test_seed_live_dry_run_skips_dms_without_slack_calls(
     finally:
         store.close()
 
-    tokens_payload = {
-        str(user["id"]): {
-            "slack_user_id": f"U{idx:08d}",
-            "access_token": f"xoxp-test-{idx}",
-        }
-        for idx, user in enumerate(users, start=1)
-    }
-    tokens_path.write_text(json.dumps(tokens_payload), encoding="utf-8")
+    _write_tokens(tokens_path, users)
 
     slack_channels_payload = {
         "channels": [{"id": "C00000001", "name": str(pub_channels[0]["name"])}]
@@ -1,19 +1,22 @@
 import random
 
+import pytest
 from faker import Faker
 
 from slack_workspace_synth.generator import (
     GenerationConfig,
+    _sentence_sampler,
+    _word_sampler,
     generate_channels,
     generate_users,
     generate_workspace,
+    iter_batches,
 )
 from slack_workspace_synth.plugins import PluginRegistry
 from slack_workspace_synth.storage import SQLiteStore
 
 
-def test_workspace_generation(tmp_path):
-    db_path = tmp_path / "demo.db"
+def test_workspace_generation():
     config = GenerationConfig(
         workspace_name="Test",
         users=5,
@@ -27,7 +30,7 @@ def test_workspace_generation(tmp_path):
     )
     plugins = PluginRegistry()
 
-    store = SQLiteStore(str(db_path))
+    store = SQLiteStore(":memory:")
     try:
         workspace = generate_workspace(config, plugins)
         store.insert_workspace(workspace)
@@ -46,3 +49,32 @@ def test_workspace_generation(tmp_path):
         assert summary["counts"]["channels"] == 3
     finally:
         store.close()
+
+
+def test_iter_batches_chunks_stream():
+    batches = list(iter_batches(iter(range(7)), 3))
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(iter_batches([], 3)) == []
+
+
+@pytest.mark.parametrize("locale", ["en_US", "ja_JP"])
+def test_sentence_sampler_matches_faker_sentence(locale):
+    # ja_JP joins words with "" and ends sentences with "。" rather than " " and ".".
+    reference = Faker(locale)
+    reference.seed_instance(7)
+    fast = Faker(locale)
+    fast.seed_instance(7)
+    sentence = _sentence_sampler(fast)
+
+    for nb_words in [1, 2, 3, *range(4, 21)] * 20:
+        assert sentence(nb_words) == reference.sentence(nb_words=nb_words)
+
+
+def test_word_sampler_matches_faker_word():
+    reference = Faker()
+    reference.seed_instance(11)
+    fast = Faker()
+    fast.seed_instance(11)
+    word = _word_sampler(fast)
+
+    assert [word() for _ in range(200)] == [reference.word() for _ in range(200)]
@@ -1,15 +1,17 @@
 import io
-import json
 from email.message import Message
 
 import pytest
 
 import slack_workspace_synth.cli as cli
 
+_OK_BODY = b'{"ok":true}'
+_RATELIMITED_BODY = b'{"ok":false,"error":"ratelimited"}'
+
 
 class _FakeResponse:
-    def __init__(self, payload: dict[str, object]) -> None:
-        self._body = json.dumps(payload).encode("utf-8")
+    def __init__(self, body: bytes) -> None:
+        self._body = body
 
     def read(self) -> bytes:  # pragma: no cover
         return self._body
@@ -38,11 +40,11 @@ def test_slack_retries_on_429(monkeypatch: pytest.MonkeyPatch) -> None:
                 429,
                 "Too Many Requests",
                 hdrs,
-                io.BytesIO(b'{"ok":false,"error":"ratelimited"}'),
+                io.BytesIO(_RATELIMITED_BODY),
             )
-        return _FakeResponse({"ok": True})
+        return _FakeResponse(_OK_BODY)
 
-    monkeypatch.setattr(cli.time, "sleep", fake_sleep)
+    monkeypatch.setattr(cli, "_sleep", fake_sleep)
     monkeypatch.setattr(cli, "urlopen", fake_urlopen)
 
     response = cli._slack_post_json(
@@ -72,10 +74,10 @@ def test_slack_retries_on_ok_false_ratelimited(monkeypatch: pytest.MonkeyPatch)
         nonlocal calls
         calls += 1
         if calls == 1:
-            return _FakeResponse({"ok": False, "error": "ratelimited"})
-        return _FakeResponse({"ok": True})
+            return _FakeResponse(_RATELIMITED_BODY)
+        return _FakeResponse(_OK_BODY)
 
-    monkeypatch.setattr(cli.time, "sleep", fake_sleep)
+    monkeypatch.setattr(cli, "_sleep", fake_sleep)
     monkeypatch.setattr(cli.random, "random", fake_random)
     monkeypatch.setattr(cli, "urlopen", fake_urlopen)
 
@@ -114,9 +116,9 @@ def test_slack_retries_on_5xx(monkeypatch: pytest.MonkeyPatch) -> None:
                 hdrs,
                 io.BytesIO(b'{"ok":false,"error":"internal_error"}'),
             )
-        return _FakeResponse({"ok": True})
+        return _FakeResponse(_OK_BODY)
 
-    monkeypatch.setattr(cli.time, "sleep", fake_sleep)
+    monkeypatch.setattr(cli, "_sleep", fake_sleep)
     monkeypatch.setattr(cli.random, "random", fake_random)
     monkeypatch.setattr(cli, "urlopen", fake_urlopen)
 
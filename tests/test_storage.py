@@ -0,0 +1,159 @@
+import pytest
+
+from slack_workspace_synth.models import User, Workspace
+from slack_workspace_synth.storage import (
+    SQLiteStore,
+    decode_channel_member_cursor,
+    decode_cursor,
+    decode_id_cursor,
+    encode_channel_member_cursor,
+    encode_cursor,
+    encode_id_cursor,
+    validate_db,
+)
+
+
+def _user(idx: int) -> User:
+    return User(
+        id=f"u{idx}",
+        workspace_id="w1",
+        name=f"User {idx}",
+        email=f"user{idx}@example.com",
+        title="Engineer",
+        is_bot=0,
+    )
+
+
+def test_transaction_commits_once_and_rolls_back_on_error(tmp_path):
+    db_path = tmp_path / "tx.db"
+    store = SQLiteStore(str(db_path))
+    try:
+        with store.transaction():
+            store.insert_workspace(Workspace(id="w1", name="Tx", created_at=1))
+            store.insert_users([_user(1), _user(2)])
+            # Nested blocks join the outer transaction.
+            with store.transaction():
+                store.insert_users([_user(3)])
+            assert store.conn.in_transaction
+
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                store.insert_users([_user(4)])
+                raise RuntimeError("boom")
+    finally:
+        store.close()
+
+    reader = SQLiteStore(str(db_path), read_only=True)
+    try:
+        assert reader.stats("w1")["users"] == 3
+    finally:
+        reader.close()
+
+
+def test_stats_reflects_writes_from_any_connection(tmp_path):
+    db_path = tmp_path / "stats.db"
+    store = SQLiteStore(str(db_path))
+    reader = SQLiteStore(str(db_path), read_only=True)
+    try:
+        store.insert_workspace(Workspace(id="w1", name="Stats", created_at=1))
+        store.insert_users([_user(1)])
+        assert store.stats("w1")["users"] == 1
+        assert reader.stats("w1")["users"] == 1
+
+        store.insert_users([_user(2)])
+        # Own writes and commits from other connections are both visible.
+        assert store.stats("w1")["users"] == 2
+        assert reader.stats("w1")["users"] == 2
+    finally:
+        reader.close()
+        store.close()
+
+
+def test_workspace_meta_round_trips_exact_values(tmp_path):
+    db_path = tmp_path / "meta.db"
+    seed = 2**64 + 1
+    store = SQLiteStore(str(db_path))
+    try:
+        store.insert_workspace(Workspace(id="w1", name="Meta", created_at=1))
+        store.set_workspace_meta("w1", {"seed": seed, "ratio": float("nan")})
+        meta = store.get_workspace_meta("w1")
+    finally:
+        store.close()
+
+    assert meta["seed"] == seed
+    assert isinstance(meta["seed"], int)
+    assert isinstance(meta["ratio"], float)
+
+    report_meta = validate_db(str(db_path), workspace_id="w1")["meta"]
+    assert report_meta["seed"] == seed
+
+
+def test_schema_has_keyset_indexes():
+    store = SQLiteStore(":memory:")
+    try:
+        names = {
+            row[0]
+            for row in store.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+        plan = store.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM messages"
+            " WHERE workspace_id = ? AND (ts, id) < (?, ?) ORDER BY ts DESC, id DESC LIMIT 1",
+            ("w1", 1, "m1"),
+        ).fetchall()
+    finally:
+        store.close()
+
+    assert {
+        "idx_users_workspace_id",
+        "idx_channels_workspace_id",
+        "idx_channels_ws_type_id",
+        "idx_channel_members_ws_channel_user",
+        "idx_messages_workspace_ts_id",
+        "idx_files_workspace_ts_id",
+    } <= names
+    # Keyset pages seek the composite index instead of sorting the workspace's rows.
+    assert "idx_messages_workspace_ts_id" in plan[0][-1]
+    assert not any("TEMP B-TREE" in row[-1] for row in plan)
+
+
+def test_reopen_drops_redundant_workspace_indexes(tmp_path):
+    db_path = tmp_path / "legacy.db"
+    store = SQLiteStore(str(db_path))
+    store.conn.execute("CREATE INDEX idx_messages_workspace ON messages(workspace_id)")
+    store.conn.commit()
+    store.close()
+
+    store = SQLiteStore(str(db_path))
+    try:
+        names = {
+            row[0]
+            for row in store.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+    finally:
+        store.close()
+
+    assert names.isdisjoint(
+        {
+            "idx_users_workspace",
+            "idx_channels_workspace",
+            "idx_messages_workspace",
+            "idx_files_workspace",
+        }
+    )
+
+
+def test_cursor_codecs_round_trip_and_reject_garbage():
+    assert decode_cursor(encode_cursor(1_700_000_000, "m-ü")) == {"ts": 1_700_000_000, "id": "m-ü"}
+    assert decode_id_cursor(encode_id_cursor("u1")) == {"id": "u1"}
+    assert decode_channel_member_cursor(encode_channel_member_cursor("c1", "u1")) == {
+        "channel_id": "c1",
+        "user_id": "u1",
+    }
+    assert decode_cursor("") is None
+
+    # Cursors are not interchangeable between endpoints, and junk is rejected.
+    for bad in ("not-a-cursor", encode_id_cursor("u1"), "dA", "%%%"):
+        with pytest.raises(ValueError, match="invalid cursor"):
+            decode_cursor(bad)
+    with pytest.raises(ValueError, match="invalid cursor"):
+        decode_channel_member_cursor(encode_cursor(1, "x"))